@@ -0,0 +1,73 @@
+import hashlib
+import logging
+import os
+import tempfile
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+def default_cache_dir() -> str:
+    """Return the default cache directory, honouring XDG_CACHE_HOME"""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'ino2epub')
+
+class DiskCache:
+    """Content-addressable on-disk cache with entries keyed by the SHA-256 of a URL"""
+
+    def __init__(self, directory: str, ttl: float):
+        """
+        Initialize the cache
+
+        Args:
+            directory: Root directory of the cache
+            ttl: Maximum age of an entry in seconds
+        """
+        self.directory = directory
+        self.ttl = ttl
+
+    def _path(self, namespace: str, key: str) -> str:
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, namespace, digest)
+
+    def get(self, namespace: str, key: str) -> Optional[bytes]:
+        """Return the cached value for key, or None if it is missing or expired"""
+        path = self._path(namespace, key)
+        try:
+            if time.time() - os.path.getmtime(path) > self.ttl:
+                os.unlink(path)
+                return None
+            with open(path, 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def set(self, namespace: str, key: str, value: bytes) -> None:
+        """Store value for key, replacing any previous entry atomically"""
+        path = self._path(namespace, key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(value)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Failed to write cache entry for {key}: {str(e)}")
+
+    def prune(self, namespace: str) -> None:
+        """Delete the expired entries of a namespace"""
+        cutoff = time.time() - self.ttl
+        try:
+            with os.scandir(os.path.join(self.directory, namespace)) as entries:
+                for entry in entries:
+                    try:
+                        if entry.stat().st_mtime < cutoff:
+                            os.unlink(entry.path)
+                    except OSError:
+                        pass
+        except OSError:
+            pass
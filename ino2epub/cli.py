@@ -1,7 +1,8 @@
 import argparse
 import logging
 import sys
-from .converter import Ino2Epub
+import traceback
+from . import __version__
 
 def setup_logging(debug: bool = False):
     """Configure logging for the application"""
@@ -20,6 +21,12 @@ def main():
         description="Convert Inoreader's read later items to EPUB"
     )
     
+    parser.add_argument(
+        "--version",
+        action="version",
+        version=f"%(prog)s {__version__}"
+    )
+
     parser.add_argument(
         "--url",
         required=True,
@@ -39,6 +46,31 @@ def main():
         help="Output EPUB file path (default: articles.epub)"
     )
 
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the on-disk article and image cache"
+    )
+
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=7,
+        help="Maximum age of cached articles and images in days (default: 7)"
+    )
+
+    parser.add_argument(
+        "--keep-original-images",
+        action="store_true",
+        help="Embed images as downloaded instead of downscaled grayscale JPEGs"
+    )
+
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Log time spent per stage and whether the run was I/O- or CPU-bound"
+    )
+
     parser.add_argument(
         "--debug",
         action="store_true",
@@ -47,19 +79,24 @@ def main():
     
     args = parser.parse_args()
     setup_logging(args.debug)
+
+    # Imported after argument parsing so --help and --version stay fast
+    from .converter import Ino2Epub
     
     try:
         converter = Ino2Epub(
             rss_url=args.url,
-            max_items=args.max_items
+            max_items=args.max_items,
+            use_cache=not args.no_cache,
+            cache_ttl=args.cache_ttl * 24 * 60 * 60,
+            optimize_images=not args.keep_original_images
         )
         
-        output_path = converter.convert(args.output, args.debug)
+        output_path = converter.convert(args.output, args.debug, args.profile)
         print(f"Successfully created EPUB file: {output_path}")
         return 0
         
     except Exception as e:
-        import traceback
         print(f"Error: {str(e)}", file=sys.stderr)
         print("\nFull traceback:", file=sys.stderr)
         traceback.print_exc()
@@ -1,5 +1,3 @@
-import feedparser
-import trafilatura
 import ebooklib
 from ebooklib import epub
 from typing import Optional, List, Dict, Tuple
@@ -7,14 +5,150 @@ import logging
 from datetime import datetime
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError, ResponseError
+from urllib3.util.retry import Retry
 from urllib.parse import urljoin, urlparse
-from bs4 import BeautifulSoup
+import lxml.html
+import cProfile
 import hashlib
+import io
+import json
 import concurrent.futures
-from functools import partial
+import multiprocessing
+import pstats
+import threading
+import time
+import zipfile
+from contextlib import nullcontext
+from xml.sax.saxutils import escape
+from .cache import DiskCache, default_cache_dir
+from .profiling import Profiler
 
 logger = logging.getLogger(__name__)
 
+# Embedded SVG logo
+_COVER_SVG = b'''<?xml version="1.0" encoding="UTF-8"?>
+<svg width="360px" height="360px" viewBox="0 0 360 360" version="1.1" xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink">
+    <title>inoreader_logo_icon_blue</title>
+    <g id="inoreader_logo_icon_blue" stroke="none" stroke-width="1" fill="none" fill-rule="evenodd">
+        <path d="M180,66.09375 C242.908685,66.09375 293.90625,117.091315 293.90625,180 C293.90625,242.908685 242.908685,293.90625 180,293.90625 C117.091315,293.90625 66.09375,242.908685 66.09375,180 C66.09375,117.091315 117.091315,66.09375 180,66.09375 Z M214.171875,111.65625 C195.29927,111.65625 180,126.95552 180,145.828125 C180,164.70073 195.29927,180 214.171875,180 C233.04448,180 248.34375,164.70073 248.34375,145.828125 C248.34375,126.95552 233.04448,111.65625 214.171875,111.65625 Z" id="Combined-Shape" fill="#1875F3" fill-rule="nonzero"></path>
+    </g>
+</svg>'''
+
+_COVER_TMPL = '''<html xmlns="http://www.w3.org/1999/xhtml" xml:lang="en">
+<head>
+    <title>Cover</title>
+    <style type="text/css">
+        img {{ max-width: 100%; display: block; margin: 0 auto; }}
+        .title {{ text-align: center; margin: 2em 0; }}
+        .date {{ text-align: center; margin: 1em 0; }}
+    </style>
+</head>
+<body>
+    <div>
+        <img src="../images/cover.svg" alt="Inoreader Logo"/>
+        <h1 class="title">Inoreader: Read Later</h1>
+        <p class="date">Compiled on {date}</p>
+    </div>
+</body>
+</html>'''
+
+_CHAPTER_TMPL = '''<html xmlns="http://www.w3.org/1999/xhtml" xml:lang="en">
+<head>
+    <title>{title}</title>
+</head>
+<body>
+    <div class="chapter">
+        <h1>{title}</h1>
+        <div class="content">
+            {content}
+        </div>
+    </div>
+</body>
+</html>'''
+
+_NAV_TMPL = '''<html xmlns="http://www.w3.org/1999/xhtml" xml:lang="en">
+<head>
+    <title>Table of Contents</title>
+</head>
+<body>
+    <div class="toc">
+        <h1>Table of Contents</h1>
+        <div class="toc-entries">{entries}
+        </div>
+    </div>
+</body>
+</html>'''
+
+_NAV_ENTRY_TMPL = '''
+            <div class="toc-entry">
+                <a href="{href}">{title}</a>
+            </div>'''
+
+def _extract_html(html: bytes, url: str) -> Tuple[Optional[str], float]:
+    """
+    Extract the main content of an article page as HTML, run in worker processes
+
+    Returns:
+        The extracted HTML, or None, and the CPU seconds the extraction took
+    """
+    # Imported lazily, trafilatura is slow to import and unused when all articles are cached
+    import trafilatura
+
+    start_cpu = time.process_time()
+    # Raw bytes let trafilatura detect the encoding itself while parsing.
+    # fast skips the readability/justext fallback extractors.
+    content = trafilatura.extract(
+        html,
+        url=url,
+        fast=True,
+        include_images=True,
+        include_formatting=True,
+        output_format='html',
+        with_metadata=False,
+        deduplicate=False,
+        favor_precision=False
+    )
+    return content, time.process_time() - start_cpu
+
+class _CappedRetry(Retry):
+    """Retry policy honouring Retry-After, giving up when it asks for more than MAX_RETRY_AFTER"""
+
+    # Longest Retry-After delay in seconds worth waiting for before retrying
+    MAX_RETRY_AFTER = 2
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        # Retrying before the requested delay would only hammer a rate-limited
+        # host, so a longer delay exhausts the retries at once
+        if response is not None:
+            retry_after = self.get_retry_after(response)
+            if retry_after is not None and retry_after > self.MAX_RETRY_AFTER:
+                raise MaxRetryError(_pool, url, ResponseError(
+                    f"Retry-After of {retry_after:g}s exceeds {self.MAX_RETRY_AFTER}s"))
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+class _EpubWriter(epub.EpubWriter):
+    """EpubWriter that stores already-compressed images instead of deflating them again"""
+
+    STORED_MEDIA_TYPES = {'image/jpeg', 'image/png', 'image/gif', 'image/webp'}
+
+    def _write_items(self):
+        items = self.book.items
+        images = [item for item in items if item.media_type in self.STORED_MEDIA_TYPES]
+        self.book.items = [item for item in items if item.media_type not in self.STORED_MEDIA_TYPES]
+        try:
+            super()._write_items()
+        finally:
+            self.book.items = items
+
+        for item in images:
+            self.out.writestr(
+                f'{self.book.FOLDER_NAME}/{item.file_name}',
+                item.get_content(),
+                compress_type=zipfile.ZIP_STORED
+            )
+
 class Ino2Epub:
     """Main converter class for transforming Inoreader RSS items to EPUB"""
     
@@ -23,10 +157,45 @@ class Ino2Epub:
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.3"
     ]
 
+    # Upper bound for the article extraction thread pool
+    MAX_WORKERS = 8
+
+    # Number of images downloaded concurrently, across all articles
+    MAX_IMAGE_WORKERS = 16
+
+    # Images are downscaled to fit within this size (e-reader resolution)
+    MAX_IMAGE_SIZE = (1200, 1600)
+
+    # Images smaller than this are embedded as-is, re-encoding is not worth it
+    MIN_OPTIMIZE_BYTES = 20 * 1024
+
+    # Maximum number of concurrent article requests sent to a single host
+    MAX_REQUESTS_PER_HOST = 2
+
+    # Maximum number of concurrent image requests sent to a single host,
+    # shared by all articles
+    MAX_IMAGE_REQUESTS_PER_HOST = 8
+
+    # (connect, read) timeout in seconds for all HTTP requests
+    REQUEST_TIMEOUT = (5, 30)
+
+    # Images larger than this are skipped instead of being embedded
+    MAX_IMAGE_BYTES = 5 * 1024 * 1024
+
+    # Article pages larger than this are skipped instead of being extracted
+    MAX_ARTICLE_BYTES = 10 * 1024 * 1024
+
+    # Article responses with any other content type are not downloaded
+    ARTICLE_CONTENT_TYPES = {'text/html', 'application/xhtml+xml'}
+
     def __init__(
         self,
         rss_url: str,
-        max_items: int = 20
+        max_items: int = 20,
+        use_cache: bool = True,
+        cache_ttl: float = 7 * 24 * 60 * 60,
+        cache_dir: Optional[str] = None,
+        optimize_images: bool = True
     ):
         """
         Initialize the converter with configuration parameters
@@ -34,31 +203,88 @@ class Ino2Epub:
         Args:
             rss_url: Inoreader RSS feed URL
             max_items: Maximum number of items to fetch (default: 20)
+            use_cache: Cache extracted articles and images on disk (default: True)
+            cache_ttl: Maximum age of cache entries in seconds (default: 7 days)
+            cache_dir: Cache directory (default: ~/.cache/ino2epub)
+            optimize_images: Downscale images and convert them to grayscale JPEG (default: True)
         """
         self.rss_url = rss_url
         self.max_items = max_items
+        self.cache = DiskCache(cache_dir or default_cache_dir(), cache_ttl) if use_cache else None
+        if self.cache:
+            for namespace in ('feeds', 'articles', 'images'):
+                self.cache.prune(namespace)
+        self.optimize_images = optimize_images
+        self._host_semaphores: Dict[Tuple[str, int], threading.Semaphore] = {}
+        self._host_semaphores_lock = threading.Lock()
+        self._image_futures: Dict[str, concurrent.futures.Future] = {}
+        self._image_futures_lock = threading.Lock()
+        self._image_index: Dict[str, str] = {}
+        self._extract_executor: Optional[concurrent.futures.ProcessPoolExecutor] = None
+        self._extract_executor_lock = threading.Lock()
+        self._extract_workers = 0
+        self._image_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self.profiler: Optional[Profiler] = None
+        self._feed_record: Optional[bytes] = None
+        self.session = self._create_session()
+
+    def _measure(self, stage: str):
+        """Time the block under stage when profiling is enabled"""
+        return self.profiler.measure(stage) if self.profiler else nullcontext()
+
+    def _count_bytes(self, count: int) -> None:
+        """Record downloaded bytes when profiling is enabled"""
+        if self.profiler:
+            self.profiler.add_bytes(count)
+
+    def _create_session(self) -> requests.Session:
+        """Create the HTTP session shared by all requests, with connection pooling and retries"""
+        session = requests.Session()
+        # Rate-limited (429) and unavailable (503) responses are retried after
+        # the delay given in their Retry-After header when it is only a few
+        # seconds, and returned as they are when the host asks for longer
+        retries = _CappedRetry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=retries)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        # Image hosts commonly reject the crawler user agent from non-Google
+        # addresses, so default to the browser one; article requests override it
+        session.headers['User-Agent'] = self.USER_AGENTS[1]
+        return session
+
+    def _host_semaphore(self, url: str, limit: int) -> threading.Semaphore:
+        """Return the semaphore allowing limit concurrent requests to the host of url"""
+        key = (urlparse(url).netloc, limit)
+        with self._host_semaphores_lock:
+            if key not in self._host_semaphores:
+                self._host_semaphores[key] = threading.Semaphore(limit)
+            return self._host_semaphores[key]
 
     def fetch_rss_items(self) -> List[Dict]:
         """Fetch RSS items from Inoreader"""
         logger.info(f"Fetching RSS feed from {self.rss_url}")
         try:
-            logger.debug(f"Attempting to parse RSS feed from URL: {self.rss_url}")
+            logger.debug("Attempting to parse RSS feed from URL: %s", self.rss_url)
             # First check if the URL is valid
             if not self.rss_url or not isinstance(self.rss_url, str):
                 raise ValueError(f"Invalid RSS URL: {self.rss_url}")
 
-            logger.debug(f"Parsing feed from URL: {self.rss_url}")
-            feed = feedparser.parse(self.rss_url)
-            
-            # Detailed feed inspection
-            logger.debug(f"Feed object type: {type(feed)}")
-            logger.debug(f"Feed object dir: {dir(feed)}")
-            logger.debug(f"Feed raw dict: {feed.__dict__}")
+            import feedparser
+
+            logger.debug("Parsing feed from URL: %s", self.rss_url)
+            feed = feedparser.parse(self._download_feed())
             
             # Check for parsing errors
             if hasattr(feed, "bozo_exception") and feed.bozo_exception:
                 logger.error(f"Feed parsing error: {feed.bozo_exception}")
                 logger.error(f"Feed content that caused error: {feed}")
+                logger.debug("Feed object type: %s, dir: %s", type(feed), dir(feed))
                 raise ValueError(f"Error parsing RSS feed: {feed.bozo_exception}")
             
             # Validate feed structure
@@ -72,21 +298,28 @@ class Ino2Epub:
                 logger.error("Feed contains no entries")
                 raise ValueError("No items found in the RSS feed")
             
-            logger.debug(f"Number of entries before slice: {len(feed.entries)}")
+            logger.debug("Number of entries before slice: %d", len(feed.entries))
             entries = feed.entries[:self.max_items]
-            logger.debug(f"Processing {len(entries)} entries")
+            logger.debug("Processing %d entries", len(entries))
+            
+            # Convert feedparser entries to plain dictionaries, skipping
+            # entries without a link as there is nothing to extract
+            items = [{
+                'title': getattr(entry, 'title', 'Untitled'),
+                'link': getattr(entry, 'link', None),
+                'description': getattr(entry, 'description', ''),
+                'published': getattr(entry, 'published', '')
+            } for entry in entries if getattr(entry, 'link', None)]
             
-            # Convert feedparser entries to plain dictionaries
-            items = []
-            for entry in entries:
-                logger.debug(f"Processing entry: {entry.title if hasattr(entry, 'title') else 'No title'}")
-                item = {
-                    'title': getattr(entry, 'title', 'Untitled'),
-                    'link': getattr(entry, 'link', None),
-                    'description': getattr(entry, 'description', ''),
-                    'published': getattr(entry, 'published', '')
-                }
-                items.append(item)
+            if len(items) < len(entries):
+                logger.warning(f"Skipped {len(entries) - len(items)} entries without a URL")
+
+            # The same article can be saved more than once, only fetch it once
+            seen = set()
+            unique_items = [item for item in items if not (item['link'] in seen or seen.add(item['link']))]
+            if len(unique_items) < len(items):
+                logger.info(f"Skipped {len(items) - len(unique_items)} duplicate entries")
+            items = unique_items
             
             logger.info(f"Found {len(items)} items")
             return items
@@ -95,30 +328,97 @@ class Ino2Epub:
             logger.error(f"Error fetching RSS items: {str(e)}")
             raise ValueError(f"Failed to fetch RSS items: {str(e)}")
 
+    def _download_feed(self) -> bytes:
+        """Download the RSS feed, revalidating a cached copy with ETag/Last-Modified"""
+        # The last response is kept on the instance so repeated conversions
+        # revalidate the feed even when the disk cache is disabled
+        cached = self._feed_record
+        if cached is None and self.cache:
+            cached = self.cache.get('feeds', self.rss_url)
+        headers = {}
+        if cached is not None:
+            header, _, cached_body = cached.partition(b'\n')
+            validators = json.loads(header)
+            if validators.get('etag'):
+                headers['If-None-Match'] = validators['etag']
+            if validators.get('last_modified'):
+                headers['If-Modified-Since'] = validators['last_modified']
+
+        response = self.session.get(self.rss_url, headers=headers, timeout=self.REQUEST_TIMEOUT)
+        if response.status_code == 304 and cached is not None:
+            logger.info("Feed not modified, using cached copy")
+            return cached_body
+        response.raise_for_status()
+        self._count_bytes(len(response.content))
+
+        validators = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified')
+        }
+        if validators['etag'] or validators['last_modified']:
+            header = json.dumps(validators).encode('utf-8')
+            self._feed_record = header + b'\n' + response.content
+            if self.cache:
+                self.cache.set('feeds', self.rss_url, self._feed_record)
+        return response.content
+
     def extract_article_content(self, url: str) -> Optional[str]:
         """Extract article content using trafilatura with fallback user agents"""
+        if self.cache:
+            cached = self.cache.get('articles', url)
+            if cached is not None:
+                logger.info(f"Using cached content for {url}")
+                return cached.decode('utf-8')
+
         logger.info(f"Extracting content from {url}")
         
         for user_agent in self.USER_AGENTS:
             try:
-                logger.debug(f"Trying with user agent: {user_agent}")
-                response = requests.get(url, headers={'User-Agent': user_agent})
-                if response.status_code != 200:
-                    logger.warning(f"Failed to download content from {url}, status code: {response.status_code}")
-                    continue
+                logger.debug("Trying with user agent: %s", user_agent)
+                # Stream the response so a rejected request is retried with the
+                # next user agent without downloading the error page body
+                with self.session.get(
+                    url,
+                    headers={'User-Agent': user_agent},
+                    stream=True,
+                    timeout=self.REQUEST_TIMEOUT
+                ) as response:
+                    # Another user agent will not lift a rate limit on the host
+                    if response.status_code == 429:
+                        logger.warning(f"Failed to download content from {url}: rate limited")
+                        return None
+                    if response.status_code != 200:
+                        logger.warning(f"Failed to download content from {url}, status code: {response.status_code}")
+                        continue
+
+                    # PDFs, videos and the like would be downloaded only to be discarded
+                    content_type = response.headers.get('content-type', '').split(';')[0].strip().lower()
+                    if content_type and content_type not in self.ARTICLE_CONTENT_TYPES:
+                        logger.warning(f"Skipping {url}: unsupported content type {content_type}")
+                        return None
 
-                content = trafilatura.extract(
-                    response.text,
-                    include_images=True,
-                    include_formatting=True,
-                    output_format='html',
-                    with_metadata=False
-                )
+                    content_length = response.headers.get('content-length')
+                    if content_length and content_length.isdigit() and int(content_length) > self.MAX_ARTICLE_BYTES:
+                        logger.warning(f"Skipping {url}: {content_length} bytes exceeds size limit")
+                        return None
+
+                    html = bytearray()
+                    for chunk in response.iter_content(chunk_size=65536):
+                        html.extend(chunk)
+                        if len(html) > self.MAX_ARTICLE_BYTES:
+                            logger.warning(f"Skipping {url}: exceeds size limit")
+                            return None
+                    html = bytes(html)
+                    self._count_bytes(len(html))
+
+                content = self._extract(html, url)
                 
                 if content:
+                    if self.cache:
+                        self.cache.set('articles', url, content.encode('utf-8'))
                     return content
                 else:
-                    logger.debug(f"No content extracted with user agent: {user_agent}")
+                    logger.debug("No content extracted with user agent: %s", user_agent)
                     
             except Exception as e:
                 logger.error(f"Error extracting content from {url} with user agent {user_agent}: {str(e)}")
@@ -127,96 +427,212 @@ class Ino2Epub:
         logger.warning(f"Failed to extract content from {url} with all user agents")
         return None
 
-    def _download_image(self, url: str, base_url: str) -> Optional[Tuple[bytes, str]]:
+    def _extract(self, html: bytes, url: str) -> Optional[str]:
+        """Run trafilatura on a page, in the extraction process pool when available"""
+        executor = self._get_extract_executor()
+        if executor is not None:
+            try:
+                content, cpu = executor.submit(_extract_html, html, url).result()
+                # The fetch thread only waits here, so its own CPU time misses this
+                if self.profiler:
+                    self.profiler.add_cpu('extract_article_content', cpu)
+                return content
+            except concurrent.futures.process.BrokenProcessPool:
+                logger.warning("Extraction process pool failed, extracting in-process")
+                with self._extract_executor_lock:
+                    self._extract_workers = 0
+        return _extract_html(html, url)[0]
+
+    def _get_extract_executor(self) -> Optional[concurrent.futures.ProcessPoolExecutor]:
+        """Return the extraction process pool, creating it on the first cache miss"""
+        with self._extract_executor_lock:
+            if self._extract_workers < 2:
+                return None
+            if self._extract_executor is None:
+                self._extract_executor = self._create_extract_executor(self._extract_workers)
+            return self._extract_executor
+
+    def _create_extract_executor(self, max_workers: int) -> concurrent.futures.ProcessPoolExecutor:
+        """Create the process pool running trafilatura"""
+        # Fetch threads are already running by now, so rather than forking this
+        # process use a fork server where available: it starts single-threaded,
+        # imports trafilatura once and forks every worker from that state
+        if 'forkserver' in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context('forkserver')
+            context.set_forkserver_preload([__name__, 'trafilatura'])
+        else:
+            context = multiprocessing.get_context()
+        return concurrent.futures.ProcessPoolExecutor(max_workers=max_workers, mp_context=context)
+
+    def _download_image(self, url: str) -> Optional[Tuple[bytes, str]]:
         """Download an image and return its content and mime type"""
+        result = self._fetch_image(url)
+        if result and self.optimize_images:
+            result = self._optimize_image(*result)
+        return result
+
+    def _fetch_image(self, url: str) -> Optional[Tuple[bytes, str]]:
+        """Fetch an image from the cache or the network"""
         try:
-            # Resolve relative URLs
-            if not bool(urlparse(url).netloc):
-                url = urljoin(base_url, url)
+            if self.cache:
+                cached = self.cache.get('images', url)
+                if cached is not None:
+                    content_type, _, content = cached.partition(b'\n')
+                    return content, content_type.decode('ascii')
                 
-            response = requests.get(url, headers={'User-Agent': self.USER_AGENTS[0]})
-            if response.status_code != 200:
-                return None
-            
-            content_type = response.headers.get('content-type', '')
-            if not content_type.startswith('image/'):
-                return None
+            with self._host_semaphore(url, self.MAX_IMAGE_REQUESTS_PER_HOST), \
+                    self.session.get(url, stream=True, timeout=self.REQUEST_TIMEOUT) as response:
+                if response.status_code != 200:
+                    return None
+                
+                # Check the headers before transferring any of the body
+                content_type = response.headers.get('content-type', '')
+                if not content_type.startswith('image/'):
+                    return None
+                
+                content_length = response.headers.get('content-length')
+                if content_length and content_length.isdigit() and int(content_length) > self.MAX_IMAGE_BYTES:
+                    logger.warning(f"Skipping image {url}: {content_length} bytes exceeds size limit")
+                    return None
                 
-            return response.content, content_type
+                content = bytearray()
+                for chunk in response.iter_content(chunk_size=65536):
+                    content.extend(chunk)
+                    if len(content) > self.MAX_IMAGE_BYTES:
+                        logger.warning(f"Skipping image {url}: exceeds size limit")
+                        return None
+                
+                self._count_bytes(len(content))
+                if self.cache:
+                    self.cache.set('images', url, content_type.encode('ascii') + b'\n' + content)
+                return bytes(content), content_type
         except Exception as e:
             logger.error(f"Error downloading image from {url}: {str(e)}")
             return None
 
-    def _process_content_images(self, content: str, book: epub.EpubBook, chapter_id: str, article_url: str) -> str:
-        """Process images in content, download them and update references"""
-        
-        soup = BeautifulSoup(content, 'html.parser')
+    def _optimize_image(self, content: bytes, mime_type: str) -> Tuple[bytes, str]:
+        """Downscale an image and re-encode it as grayscale JPEG for e-readers"""
+        if len(content) < self.MIN_OPTIMIZE_BYTES or mime_type.startswith('image/svg'):
+            return content, mime_type
+
+        from PIL import Image, ImageOps
+
+        try:
+            with Image.open(io.BytesIO(content)) as image:
+                if getattr(image, 'is_animated', False):
+                    return content, mime_type
+
+                # Let JPEGs decode straight to grayscale at a reduced scale. The
+                # bound is square as EXIF orientation may still swap the axes.
+                side = max(self.MAX_IMAGE_SIZE)
+                image.draft('L', (side, side))
+                image = ImageOps.exif_transpose(image)
+
+                # Flatten transparency onto white, as JPEG has no alpha channel
+                if image.mode in ('RGBA', 'LA', 'P'):
+                    image = image.convert('RGBA')
+                    background = Image.new('RGBA', image.size, 'white')
+                    image = Image.alpha_composite(background, image)
+
+                image.thumbnail(self.MAX_IMAGE_SIZE, Image.LANCZOS)
+                image = image.convert('L')
+                output = io.BytesIO()
+                image.save(output, format='JPEG', quality=75, optimize=True, progressive=True)
+        except Exception as e:
+            logger.debug("Keeping original image, could not optimize it: %s", e)
+            return content, mime_type
+
+        optimized = output.getvalue()
+        if len(optimized) >= len(content):
+            return content, mime_type
+        return optimized, 'image/jpeg'
+
+    def _schedule_image_downloads(self, tree: lxml.html.HtmlElement, article_url: str) -> None:
+        """Queue downloads for the images referenced in the content"""
+        # Handle both <img> and <graphic> tags. Images shared between articles
+        # are only downloaded once per book.
+        for img in tree.iter('img', 'graphic'):
+            src = img.get('src')
+            if not src:
+                continue
+            url = urljoin(article_url, src)
+            with self._image_futures_lock:
+                if url not in self._image_futures:
+                    self._image_futures[url] = self._image_executor.submit(self._download_image, url)
+
+    def _process_content_images(self, tree: lxml.html.HtmlElement, book: epub.EpubBook, article_url: str) -> str:
+        """Add downloaded images to the book and update references in content"""
         
         # Handle both <img> and <graphic> tags
-        for img in soup.find_all(['img', 'graphic']):
+        for img in tree.iter('img', 'graphic'):
             src = img.get('src')
             if not src:
                 continue
-                
-            # Download the image
-            result = self._download_image(src, article_url)
-            if not result:
-                continue
-                
-            image_content, mime_type = result
-            
-            # Generate a unique filename based on URL
-            ext = mime_type.split('/')[-1].lower()
-            # Handle special cases
-            if ext == 'jpeg':
-                ext = 'jpg'
-            elif ext == 'svg+xml':
-                ext = 'svg'
-            filename = hashlib.md5(src.encode()).hexdigest()[:10] + '.' + ext
-            image_path = f'images/{chapter_id}/{filename}'
-            
-            # Create image item
-            image_item = epub.EpubItem(
-                uid=f'image_{filename}',
-                file_name=image_path,
-                media_type=mime_type,
-                content=image_content
-            )
-            book.add_item(image_item)
+
+            # Reuse images already added to the book, matched by URL or content
+            image_url = urljoin(article_url, src)
+            image_path = self._image_index.get(image_url)
+            if image_path is None:
+                future = self._image_futures.get(image_url)
+                result = future.result() if future else None
+                if not result:
+                    continue
+                    
+                image_content, mime_type = result
+                content_key = hashlib.blake2b(image_content, digest_size=10).hexdigest()
+                image_path = self._image_index.get(content_key)
+                if image_path is None:
+                    image_path = self._add_image(book, content_key, image_content, mime_type)
+                    self._image_index[content_key] = image_path
+                self._image_index[image_url] = image_path
             
             # Convert graphic elements to img elements and update references
-            if img.name == 'graphic':
-                new_img = soup.new_tag('img')
-                new_img['src'] = f'../images/{chapter_id}/{filename}'
-                if img.get('alt'):
-                    new_img['alt'] = img['alt']
-                img.replace_with(new_img)
+            if img.tag == 'graphic':
+                alt = img.get('alt')
+                img.attrib.clear()
+                img.tag = 'img'
+                img.set('src', f'../{image_path}')
+                if alt:
+                    img.set('alt', alt)
             else:
-                img['src'] = f'../images/{chapter_id}/{filename}'
+                img.set('src', f'../{image_path}')
         
-        return str(soup)
+        return lxml.html.tostring(tree, encoding='unicode', method='xml')
+
+    def _add_image(self, book: epub.EpubBook, content_key: str, image_content: bytes, mime_type: str) -> str:
+        """Add an image to the book and return its path"""
+        # Images are shared by all chapters and named after their content hash
+        ext = mime_type.split('/')[-1].lower()
+        # Handle special cases
+        if ext == 'jpeg':
+            ext = 'jpg'
+        elif ext == 'svg+xml':
+            ext = 'svg'
+        filename = content_key + '.' + ext
+        image_path = f'images/shared/{filename}'
+        
+        # Create image item
+        image_item = epub.EpubItem(
+            uid=f'image_{content_key}',
+            file_name=image_path,
+            media_type=mime_type,
+            content=image_content
+        )
+        book.add_item(image_item)
+        return image_path
 
     def _create_cover(self, book: epub.EpubBook) -> epub.EpubHtml:
         """Create a cover page"""
         logger.info("Creating cover page")
         
-        # Embedded SVG logo
-        svg_content = '''<?xml version="1.0" encoding="UTF-8"?>
-<svg width="360px" height="360px" viewBox="0 0 360 360" version="1.1" xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink">
-    <title>inoreader_logo_icon_blue</title>
-    <g id="inoreader_logo_icon_blue" stroke="none" stroke-width="1" fill="none" fill-rule="evenodd">
-        <path d="M180,66.09375 C242.908685,66.09375 293.90625,117.091315 293.90625,180 C293.90625,242.908685 242.908685,293.90625 180,293.90625 C117.091315,293.90625 66.09375,242.908685 66.09375,180 C66.09375,117.091315 117.091315,66.09375 180,66.09375 Z M214.171875,111.65625 C195.29927,111.65625 180,126.95552 180,145.828125 C180,164.70073 195.29927,180 214.171875,180 C233.04448,180 248.34375,164.70073 248.34375,145.828125 C248.34375,126.95552 233.04448,111.65625 214.171875,111.65625 Z" id="Combined-Shape" fill="#1875F3" fill-rule="nonzero"></path>
-    </g>
-</svg>'''
-        
         # Add cover image
         cover_img = epub.EpubItem(
             uid='cover-image',
             file_name='images/cover.svg',
             media_type='image/svg+xml',
-            content=svg_content.encode('utf-8')
+            content=_COVER_SVG
         )
-        logger.debug(f"Created cover image item with path: {cover_img.file_name}")
+        logger.debug("Created cover image item with path: %s", cover_img.file_name)
         book.add_item(cover_img)
         
         # Add cover metadata
@@ -231,51 +647,64 @@ class Ino2Epub:
             lang='en'
         )
         
-        cover.content = '''<html xmlns="http://www.w3.org/1999/xhtml" xml:lang="en">
-<head>
-    <title>Cover</title>
-    <style type="text/css">
-        img {{ max-width: 100%; display: block; margin: 0 auto; }}
-        .title {{ text-align: center; margin: 2em 0; }}
-        .date {{ text-align: center; margin: 1em 0; }}
-    </style>
-</head>
-<body>
-    <div>
-        <img src="../images/cover.svg" alt="Inoreader Logo"/>
-        <h1 class="title">Inoreader: Read Later</h1>
-        <p class="date">Compiled on {}</p>
-    </div>
-</body>
-</html>'''.format(datetime.now().strftime('%Y-%m-%d'))
+        cover.content = _COVER_TMPL.format(date=datetime.now().strftime('%Y-%m-%d'))
         
         return cover
 
-    def _process_article(self, item: Dict, index: int, book: epub.EpubBook) -> Optional[Tuple[epub.EpubHtml, int]]:
-        """Process a single article and return its chapter"""
+    def _fetch_article(self, item: Dict, index: int) -> Optional[Tuple[str, Optional[lxml.html.HtmlElement]]]:
+        """Download and extract the content of a single article, and queue its images
+
+        Returns the extracted content, along with its parsed tree when it references images
+        """
         try:
             if not isinstance(item, dict):
                 logger.error(f"Invalid item type: {type(item)}. Item: {item}")
                 return None
 
-            logger.debug(f"Processing item {index+1}: {item}")
+            logger.debug("Processing item %d: %s", index + 1, item)
             title = item.get('title', f"Article {index+1}")
-            url = item.get('link')
-            
-            if not url:
-                logger.warning(f"No URL found for article: {title}")
-                return None
+            url = item['link']
                 
-            content = self.extract_article_content(url)
+            with self._host_semaphore(url, self.MAX_REQUESTS_PER_HOST):
+                with self._measure('extract_article_content'):
+                    content = self.extract_article_content(url)
             if not content:
                 logger.warning(f"No content extracted for article: {title}")
                 return None
+
+            # Text-only articles need no parsing or image rewriting, only the
+            # <html>/<body> wrapper of the extracted document is cut off
+            if '<img' not in content and '<graphic' not in content:
+                start = content.find('<body')
+                end = content.rfind('</body>')
+                if start != -1 and end != -1:
+                    content = content[content.index('>', start) + 1:end]
+                return content, None
+
+            # Parse as a fragment, dropping the <html>/<body> wrapper of the
+            # extracted document as the content is embedded into a chapter
+            tree = lxml.html.fragment_fromstring(content, create_parent='div')
+            self._schedule_image_downloads(tree, url)
+            return content, tree
             
-            # Create unique ID for chapter
-            chapter_id = f'chapter_{index+1}'
+        except Exception as e:
+            logger.error(f"Error processing item {index+1}: {str(e)}")
+            return None
+
+    def _process_article(self, item: Dict, index: int, article: Tuple[str, Optional[lxml.html.HtmlElement]],
+                         book: epub.EpubBook) -> Optional[epub.EpubHtml]:
+        """Build the chapter for a fetched article and add it to the book"""
+        try:
+            title = item.get('title', f"Article {index+1}")
+            url = item['link']
+            content, tree = article
             
             # Process images in content
-            processed_content = self._process_content_images(content, book, chapter_id, url)
+            if tree is None:
+                processed_content = content
+            else:
+                with self._measure('_process_content_images'):
+                    processed_content = self._process_content_images(tree, book, url)
             
             # Create chapter
             chapter = epub.EpubHtml(
@@ -284,27 +713,40 @@ class Ino2Epub:
                 lang='en'
             )
             
-            chapter.content = f'''<html xmlns="http://www.w3.org/1999/xhtml" xml:lang="en">
-<head>
-    <title>{title}</title>
-</head>
-<body>
-    <div class="chapter">
-        <h1>{title}</h1>
-        <div class="content">
-            {processed_content}
-        </div>
-    </div>
-</body>
-</html>'''
+            chapter.content = _CHAPTER_TMPL.format(title=escape(title), content=processed_content)
             
             book.add_item(chapter)
-            return chapter, index
+            return chapter
             
         except Exception as e:
             logger.error(f"Error processing item {index+1}: {str(e)}")
             return None
 
+    def _fetch_articles(self, items: List[Dict], debug: bool) -> Dict[int, Tuple[str, Optional[lxml.html.HtmlElement]]]:
+        """Fetch and extract all articles, keyed by their index in items"""
+        # Download articles in parallel (sequentially in debug mode), handing
+        # the CPU-bound trafilatura extraction to a process pool
+        max_workers = 1 if debug else max(1, min(self.max_items, self.MAX_WORKERS))
+        articles = {}
+        self._extract_workers = 0 if debug else min(os.cpu_count() or 1, self.MAX_WORKERS, len(items))
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                future_to_index = {executor.submit(self._fetch_article, item, i): i
+                                   for i, item in enumerate(items)}
+                
+                for future in concurrent.futures.as_completed(future_to_index):
+                    article = future.result()
+                    if article:
+                        articles[future_to_index[future]] = article
+        finally:
+            # The pool only lives for this batch, later direct calls extract in-process
+            with self._extract_executor_lock:
+                self._extract_workers = 0
+                if self._extract_executor is not None:
+                    self._extract_executor.shutdown()
+                    self._extract_executor = None
+        return articles
+
     def create_epub(self, items: List[Dict], output_path: str = "articles.epub", debug: bool = False):
         """Create EPUB file from RSS items"""
         logger.info("Creating EPUB file")
@@ -322,35 +764,27 @@ class Ino2Epub:
         
         chapters = []
         spine = [cover]
+        self._image_futures.clear()
+        self._image_index.clear()
 
-        # Process articles either sequentially (debug) or in parallel
-        if debug:
-            # Sequential processing for debug mode
+        # Images are downloaded in a shared pool while articles are still being
+        # fetched. Chapters are built on the main thread afterwards, as ebooklib
+        # is not thread-safe and the spine has to follow the feed order.
+        self._image_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1 if debug else self.MAX_IMAGE_WORKERS
+        )
+        try:
+            articles = self._fetch_articles(items, debug)
             for i, item in enumerate(items):
-                result = self._process_article(item, i, book)
-                if result:
-                    chapter, _ = result
+                if i not in articles:
+                    continue
+                chapter = self._process_article(item, i, articles[i], book)
+                if chapter:
                     chapters.append(chapter)
-        else:
-            # Parallel processing with max 10 concurrent tasks
-            with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-                # Create partial function with book argument
-                process_func = partial(self._process_article, book=book)
-                # Submit all tasks
-                future_to_item = {executor.submit(process_func, item, i): i 
-                                for i, item in enumerate(items)}
-                
-                # Collect results as they complete
-                completed_chapters = []
-                for future in concurrent.futures.as_completed(future_to_item):
-                    result = future.result()
-                    if result:
-                        chapter, index = result
-                        completed_chapters.append((chapter, index))
-                
-                # Sort chapters by original index
-                completed_chapters.sort(key=lambda x: x[1])
-                chapters = [chapter for chapter, _ in completed_chapters]
+        finally:
+            self._image_executor.shutdown()
+            self._image_executor = None
+            self._image_futures.clear()
                 
         # Add chapters to spine
         spine.extend(chapters)
@@ -364,28 +798,13 @@ class Ino2Epub:
         )
         
         # Build TOC content
-        nav_content = '''<html xmlns="http://www.w3.org/1999/xhtml" xml:lang="en">
-<head>
-    <title>Table of Contents</title>
-</head>
-<body>
-    <div class="toc">
-        <h1>Table of Contents</h1>
-        <div class="toc-entries">'''
-        
-        for chapter in chapters:
-            nav_content += f'''
-            <div class="toc-entry">
-                <a href="{os.path.basename(chapter.file_name)}">{chapter.title}</a>
-            </div>'''
-            
-        nav_content += '''
-        </div>
-    </div>
-</body>
-</html>'''
-        
-        nav.content = nav_content
+        nav.content = _NAV_TMPL.format(entries=''.join(
+            _NAV_ENTRY_TMPL.format(
+                href=escape(chapter.file_name.rsplit('/', 1)[-1], {'"': '&quot;'}),
+                title=escape(chapter.title)
+            )
+            for chapter in chapters
+        ))
         book.add_item(nav)
         
         # Add NCX file for EPUB2 compatibility
@@ -400,19 +819,43 @@ class Ino2Epub:
         
         # Write the EPUB file
         logger.info(f"Writing EPUB to {output_path}")
-        epub.write_epub(output_path, book, {})
+        with self._measure('write_epub'):
+            writer = _EpubWriter(output_path, book, {})
+            writer.process()
+            writer.write()
         
         return output_path
 
-    def convert(self, output_path: str = "articles.epub", debug: bool = False) -> str:
+    def convert(self, output_path: str = "articles.epub", debug: bool = False, profile: bool = False) -> str:
         """
         Main conversion method that orchestrates the entire process
         
         Args:
             output_path: Path where the EPUB file should be saved
+            debug: Process articles sequentially with debug output
+            profile: Log wall/CPU time per stage, plus cProfile stats of the
+                EPUB creation in debug mode
             
         Returns:
             Path to the generated EPUB file
         """
-        items = self.fetch_rss_items()
-        return self.create_epub(items, output_path, debug)
+        self.profiler = Profiler() if profile else None
+        try:
+            with self._measure('fetch_rss_items'):
+                items = self.fetch_rss_items()
+
+            if profile and debug:
+                profiler = cProfile.Profile()
+                result = profiler.runcall(self.create_epub, items, output_path, debug)
+                if logger.isEnabledFor(logging.DEBUG):
+                    stats = io.StringIO()
+                    pstats.Stats(profiler, stream=stats).sort_stats('cumulative').print_stats(25)
+                    logger.debug("cProfile of create_epub:\n%s", stats.getvalue())
+            else:
+                result = self.create_epub(items, output_path, debug)
+
+            if self.profiler:
+                self.profiler.report()
+            return result
+        finally:
+            self.profiler = None
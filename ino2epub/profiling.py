@@ -0,0 +1,64 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List
+
+logger = logging.getLogger(__name__)
+
+class Profiler:
+    """Collects wall and CPU time per conversion stage along with downloaded bytes"""
+
+    # Runs spending less than this share of their wall time on CPU are I/O-bound
+    IO_BOUND_RATIO = 0.3
+
+    def __init__(self):
+        self.stages: Dict[str, List[float]] = {}
+        self.bytes_downloaded = 0
+        self.worker_cpu = 0.0
+        self._lock = threading.Lock()
+        self._start_wall = time.perf_counter()
+        self._start_cpu = time.process_time()
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        """Accumulate the wall and CPU time spent in the block under stage"""
+        start_wall = time.perf_counter()
+        start_cpu = time.thread_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - start_wall
+            cpu = time.thread_time() - start_cpu
+            with self._lock:
+                totals = self.stages.setdefault(stage, [0, 0.0, 0.0])
+                totals[0] += 1
+                totals[1] += wall
+                totals[2] += cpu
+
+    def add_cpu(self, stage: str, seconds: float) -> None:
+        """Record CPU time spent on stage in worker processes, which measure cannot see"""
+        with self._lock:
+            self.stages.setdefault(stage, [0, 0.0, 0.0])[2] += seconds
+            self.worker_cpu += seconds
+
+    def add_bytes(self, count: int) -> None:
+        """Record bytes downloaded from the network"""
+        with self._lock:
+            self.bytes_downloaded += count
+
+    def report(self) -> None:
+        """Log a summary table and classify the run as I/O-bound or CPU-bound"""
+        wall = time.perf_counter() - self._start_wall
+        cpu = time.process_time() - self._start_cpu + self.worker_cpu
+
+        lines = [f"{'Stage':<28}{'Calls':>7}{'Wall (s)':>11}{'CPU (s)':>10}"]
+        for stage, (calls, stage_wall, stage_cpu) in self.stages.items():
+            lines.append(f"{stage:<28}{calls:>7}{stage_wall:>11.3f}{stage_cpu:>10.3f}")
+        lines.append(f"{'Total':<28}{'':>7}{wall:>11.3f}{cpu:>10.3f}")
+        lines.append(f"Downloaded {self.bytes_downloaded / 1024:.1f} KiB")
+        logger.info("Profile summary:\n%s", "\n".join(lines))
+
+        ratio = cpu / wall if wall else 0.0
+        kind = "I/O-bound" if ratio < self.IO_BOUND_RATIO else "CPU-bound"
+        logger.info(f"Run was {kind} (CPU/wall ratio {ratio:.2f})")
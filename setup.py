@@ -9,7 +9,8 @@ setup(
         "trafilatura>=2.0.0",
         "ebooklib",
         "requests>=2.31.0",
-        "beautifulsoup4>=4.12.0",
+        "lxml",
+        "Pillow",
         "lxml_html_clean>=0.4.1",
     ],
     entry_points={